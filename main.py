@@ -1,8 +1,23 @@
 import os
+import re
+import time
+import random
+import bisect
+import asyncio
+import contextlib
+import contextvars
 import logging
-import requests
+import aiohttp
+import orjson
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from collections import defaultdict
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import TelegramError
 from telegram.ext import (
     ApplicationBuilder,  # Changed from Application.builder()
     CommandHandler,
@@ -30,197 +45,482 @@ PRICE_API_URL = "https://api.coingecko.com/api/v3/simple/price"
 SUISCAN_URL = "https://suiscan.xyz/mainnet/account/"
 SUIVISION_URL = "https://suivision.xyz/account/"
 
-# Function to get SUI price and known token prices
-async def get_token_prices():
+# Sui account addresses are 0x followed by 32 bytes of hex
+SUI_ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{64}")
+
+# Smallest-unit divisors for coins we know how to convert (1 SUI = 10^9 MIST)
+COIN_DIVISORS = {"0x2::sui::SUI": 1_000_000_000}
+
+# Send independent Sui RPCs as JSON-RPC batches; set to False to send them as parallel requests
+# instead if the endpoint rate-limits or deprioritizes batches
+USE_BATCH_RPC = True
+RPC_BATCH_SIZE = 10
+
+# Sui full nodes return at most 50 items per page of a list query; RPC_MAX_PAGES bounds
+# how far we follow nextCursor so very large wallets can't stall a command
+RPC_PAGE_LIMIT = 50
+RPC_MAX_PAGES = 20
+RPC_LISTING_CAP = RPC_PAGE_LIMIT * RPC_MAX_PAGES
+
+# Shown when a wallet listing stopped at RPC_LISTING_CAP items, so totals only cover what was fetched
+TRUNCATED_NOTE = f"⚠️ _Partial results: only the first {RPC_LISTING_CAP} coins/objects were counted_\n"
+
+# Token prices are cached in-process so CoinGecko is hit at most once per window
+PRICE_CACHE_TTL = 120  # seconds
+_PRICE_CACHE = {"ts": 0.0, "data": None}
+_PRICE_LOCK = asyncio.Lock()
+
+# Optional Redis cache shared by all bot workers and surviving restarts; disabled when REDIS_URL is unset
+# Short socket timeouts make a hung Redis look like a cache miss instead of stalling the commands that wait on it
+REDIS_URL = os.environ.get("REDIS_URL")
+REDIS_TIMEOUT = 0.5  # seconds
+_REDIS = (
+    aioredis.Redis.from_url(REDIS_URL, socket_timeout=REDIS_TIMEOUT, socket_connect_timeout=REDIS_TIMEOUT)
+    if REDIS_URL else None
+)
+
+# Redis keys and TTLs (seconds) for the shared cache
+PRICE_REDIS_KEY = "sui:price:v1"
+PRICE_REDIS_TTL = 300
+WALLET_REDIS_TTL = 30
+ACTIVITY_REDIS_TTL = 60
+TOKEN_INFO_REDIS_TTL = 3600
+TOKEN_ACTIVITY_REDIS_TTL = 30
+
+# Telegram user ids allowed to run admin commands such as /flush_cache, comma separated
+ADMIN_USER_IDS = frozenset(
+    int(user_id) for user_id in os.environ.get("ADMIN_USER_IDS", "").split(",") if user_id.strip().isdigit()
+)
+
+# Per-address caches for wallet lookups, so repeated /check and /token calls hit memory
+_COIN_CACHE = TTLCache(maxsize=4096, ttl=30)
+_OBJECT_CACHE = TTLCache(maxsize=4096, ttl=30)
+_ACTIVITY_CACHE = TTLCache(maxsize=4096, ttl=60)
+
+# Per-token caches: immutable facts for an hour, recent activity for 30 seconds
+_TOKEN_STATIC_CACHE = TTLCache(maxsize=1024, ttl=3600)
+_TOKEN_ACTIVITY_CACHE = TTLCache(maxsize=1024, ttl=30)
+
+# Trading event snapshots change slowly and a few tokens get polled repeatedly
+_TRADING_CACHE = TTLCache(maxsize=512, ttl=90)
+_CACHE_LOCKS = defaultdict(asyncio.Lock)
+
+# Outbound HTTP timeouts so a hung Sui node or CoinGecko can't stall a command
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3)
+
+# JSON headers for request bodies that are serialized with orjson
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Cap in-flight Sui RPCs across all commands so bursts don't trip the public node's rate limit;
+# throttled (429) and 5xx responses are retried with jittered exponential backoff
+MAX_CONCURRENT_RPC = 8
+RPC_MAX_RETRIES = 3
+RPC_BACKOFF_BASE = 0.25  # seconds
+_RPC_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_RPC)
+
+# Background wallet prefetches share a separate budget of one in-flight RPC, so they can hold at most
+# one of the MAX_CONCURRENT_RPC slots; _BACKGROUND_RPC marks RPCs made from a prefetch task and
+# running tasks are kept referenced in _BACKGROUND_TASKS until they finish. New prefetches are
+# dropped once PREFETCH_MAX_PENDING are waiting, so the backlog can't grow under load
+PREFETCH_MAX_CONCURRENT_RPC = 1
+PREFETCH_MAX_PENDING = 8
+_PREFETCH_RPC_SEMAPHORE = asyncio.Semaphore(PREFETCH_MAX_CONCURRENT_RPC)
+_BACKGROUND_RPC = contextvars.ContextVar("background_rpc", default=False)
+_BACKGROUND_TASKS = set()
+
+# Send a JSON-RPC request to the Sui full node over the shared session
+async def _post_rpc(session, payload):
+    body = orjson.dumps(payload)
     try:
-        # Get SUI price from CoinGecko
-        params = {
-            "ids": "sui",
-            "vs_currencies": "usd"
-        }
+        background_limit = _PREFETCH_RPC_SEMAPHORE if _BACKGROUND_RPC.get() else contextlib.nullcontext()
+        for attempt in range(RPC_MAX_RETRIES + 1):
+            async with background_limit, _RPC_SEMAPHORE:
+                async with session.post(SUI_RPC_URL, data=body, headers=JSON_HEADERS) as response:
+                    if response.status != 429 and response.status < 500:
+                        return orjson.loads(await response.read())
+                    if attempt == RPC_MAX_RETRIES:
+                        logger.warning(f"Sui RPC request failed with HTTP {response.status} after {RPC_MAX_RETRIES} retries")
+                        return {"error": {"message": f"Sui RPC request failed with HTTP {response.status}"}}
+            
+            # Back off outside the semaphore so a throttled call doesn't hold a slot while it waits
+            await asyncio.sleep(RPC_BACKOFF_BASE * 2 ** attempt * random.uniform(0.5, 1.5))
+    except asyncio.TimeoutError:
+        logger.warning("Sui RPC request timed out")
+        return {"error": {"message": "Sui RPC request timed out"}}
+    except (aiohttp.ClientError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Sui RPC request failed: {str(e)}")
+        return {"error": {"message": f"Sui RPC request failed: {str(e)}"}}
+
+# Send several JSON-RPC requests in one POST; responses are matched back by id
+async def _post_rpc_batch(session, payloads):
+    batch = [dict(payload, id=index) for index, payload in enumerate(payloads)]
+    data = await _post_rpc(session, batch)
+    
+    # The node answers a rejected batch with a single error object
+    if not isinstance(data, list):
+        return [data] * len(payloads)
+    
+    by_id = {item.get("id"): item for item in data}
+    return [
+        by_id.get(index, {"error": {"message": "No response for batched request"}})
+        for index in range(len(payloads))
+    ]
+
+# Send several independent JSON-RPC requests, batched or concurrently depending on USE_BATCH_RPC
+# Results keep the order of payloads; failed requests come back as exceptions like gather(return_exceptions=True)
+async def _post_rpc_many(session, payloads):
+    if not USE_BATCH_RPC:
+        return await asyncio.gather(*(_post_rpc(session, payload) for payload in payloads), return_exceptions=True)
+    
+    chunks = [payloads[i:i + RPC_BATCH_SIZE] for i in range(0, len(payloads), RPC_BATCH_SIZE)]
+    chunk_results = await asyncio.gather(*(_post_rpc_batch(session, chunk) for chunk in chunks), return_exceptions=True)
+    
+    results = []
+    for chunk, chunk_result in zip(chunks, chunk_results):
+        if isinstance(chunk_result, Exception):
+            results.extend([chunk_result] * len(chunk))
+        else:
+            results.extend(chunk_result)
+    return results
+
+# Failed lookups are never cached so the next call retries; "partial" marks a result that is still
+# worth showing but is missing data because one of the RPCs behind it failed
+def _is_cacheable(value):
+    return value is not None and not (isinstance(value, dict) and (value.get("error") or value.get("partial")))
+
+# Raise if an RPC result is an exception or a JSON-RPC/transport error, so callers can handle both in one except
+def _raise_for_rpc_error(data):
+    if isinstance(data, Exception):
+        raise data
+    if "error" in data:
+        raise RuntimeError(str(data["error"]))
+
+# Read-through Redis cache; goes straight to fetch() when Redis is not configured or unavailable
+async def cache_aside(key, ttl, fetch):
+    if _REDIS is None:
+        return await fetch()
+    
+    try:
+        cached = await _REDIS.get(key)
+        if cached is not None:
+            return orjson.loads(cached)
+    except RedisError as e:
+        logger.warning(f"Redis read failed for {key}: {str(e)}")
+    except orjson.JSONDecodeError as e:
+        # A corrupt entry is treated as a miss and overwritten below
+        logger.warning(f"Ignoring corrupt Redis entry for {key}: {str(e)}")
+    
+    value = await fetch()
+    
+    if _is_cacheable(value):
+        try:
+            await _REDIS.set(key, orjson.dumps(value), ex=ttl)
+        except RedisError as e:
+            logger.warning(f"Redis write failed for {key}: {str(e)}")
+    
+    return value
+
+# Return a cached value, or run fetch() once for all concurrent callers on a miss
+async def _cached(cache, key, fetch):
+    value = cache.get(key)
+    if value is not None:
+        return value
+    
+    # Background prefetches never take the single-flight lock: holding it while throttled would make a
+    # foreground caller for the same key wait behind the prefetch budget. They skip keys a foreground
+    # call is already fetching, and a foreground call that arrives mid-prefetch just fetches on its own
+    if _BACKGROUND_RPC.get():
+        if key in _CACHE_LOCKS:
+            return None
+        value = await fetch()
+        if _is_cacheable(value) and cache.get(key) is None:
+            cache[key] = value
+        return value
+    
+    lock = _CACHE_LOCKS[key]
+    try:
+        async with lock:
+            value = cache.get(key)
+            if value is None:
+                value = await fetch()
+                if _is_cacheable(value):
+                    cache[key] = value
+            return value
+    finally:
+        # Waiters keep their reference to the lock, new callers will find the cached value
+        if _CACHE_LOCKS.get(key) is lock:
+            del _CACHE_LOCKS[key]
+
+# Function to fetch SUI price and known token prices from CoinGecko
+async def _fetch_token_prices(session):
+    # Get SUI price from CoinGecko
+    params = {
+        "ids": "sui",
+        "vs_currencies": "usd"
+    }
+    
+    async with session.get(PRICE_API_URL, params=params) as response:
+        data = orjson.loads(await response.read())
+    
+    # Rate-limit and error responses carry no price
+    if "sui" not in data:
+        return None
+    
+    # Add other known token prices here
+    # In a production environment, you would have a more comprehensive token price database
+    # This is a simplified example with just SUI
+    
+    return {
+        "0x2::sui::SUI": data["sui"].get("usd", 0)
+    }
+
+# Function to get SUI price and known token prices
+async def get_token_prices(session):
+    # Serve cached prices while they are still fresh
+    if _PRICE_CACHE["data"] is not None and time.monotonic() - _PRICE_CACHE["ts"] < PRICE_CACHE_TTL:
+        return _PRICE_CACHE["data"]
+    
+    # Only one coroutine refreshes at a time, the others reuse its result
+    async with _PRICE_LOCK:
+        now = time.monotonic()
+        if _PRICE_CACHE["data"] is not None and now - _PRICE_CACHE["ts"] < PRICE_CACHE_TTL:
+            return _PRICE_CACHE["data"]
         
-        response = requests.get(PRICE_API_URL, params=params)
-        data = response.json()
+        try:
+            prices = await cache_aside(PRICE_REDIS_KEY, PRICE_REDIS_TTL, lambda: _fetch_token_prices(session))
+            
+            if prices is not None:
+                _PRICE_CACHE["ts"] = now
+                _PRICE_CACHE["data"] = prices
+                return prices
+        except Exception as e:
+            logger.error(f"Error fetching token prices: {str(e)}")
         
-        prices = {
-            "0x2::sui::SUI": data.get("sui", {}).get("usd", 0)
+        return _PRICE_CACHE["data"] or {"0x2::sui::SUI": 0}
+
+# Collect every page of a paginated Sui list query; cursor_index is the cursor's position in params
+async def _fetch_all_pages(session, method, params, cursor_index):
+    params = list(params)
+    items = []
+    
+    for _ in range(RPC_MAX_PAGES):
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": method,
+            "params": params
         }
         
-        # Add other known token prices here
-        # In a production environment, you would have a more comprehensive token price database
-        # This is a simplified example with just SUI
+        data = await _post_rpc(session, payload)
         
-        return prices
-    except Exception as e:
-        logger.error(f"Error fetching token prices: {str(e)}")
-        return {"0x2::sui::SUI": 0}
+        if "result" not in data or "data" not in data["result"]:
+            # A listing missing pages would be cached and shown as if it were complete, so fail the whole
+            # lookup; None is never cached and callers report it as an error
+            if items:
+                logger.warning(f"{method} failed after {len(items)} items; discarding the partial listing")
+            return None
+        
+        items.extend(data["result"]["data"])
+        
+        if not data["result"].get("hasNextPage") or not data["result"].get("nextCursor"):
+            break
+        params[cursor_index] = data["result"]["nextCursor"]
+    
+    return items
 
-# Function to fetch wallet balance
-async def get_wallet_balance(wallet_address):
+# Function to fetch the coin objects owned by a wallet
+async def _fetch_coins(session, wallet_address):
+    return await _cached(
+        _COIN_CACHE,
+        ("coins", wallet_address),
+        lambda: cache_aside(
+            f"sui:coins:{wallet_address}",
+            WALLET_REDIS_TTL,
+            lambda: _fetch_all_pages(session, "suix_getAllCoins", [wallet_address, None, RPC_PAGE_LIMIT], 1)
+        )
+    )
+
+# Function to fetch the NFTs and other objects owned by a wallet
+async def _fetch_owned_objects(session, wallet_address):
+    return await _cached(
+        _OBJECT_CACHE,
+        ("owned_objects", wallet_address),
+        lambda: cache_aside(
+            f"sui:objects:{wallet_address}",
+            WALLET_REDIS_TTL,
+            lambda: _fetch_all_pages(
+                session,
+                "suix_getOwnedObjects",
+                [wallet_address, {"options": {"showType": True}}, None, RPC_PAGE_LIMIT],
+                2
+            )
+        )
+    )
+
+# Function to fetch the total SUI balance when the coin list is unavailable
+async def _fetch_sui_balance(session, wallet_address, prices):
     try:
-        # First check all coins
         payload = {
             "jsonrpc": "2.0",
             "id": 1,
-            "method": "suix_getAllCoins",
-            "params": [wallet_address, None, 50]
+            "method": "suix_getBalance",
+            "params": [wallet_address, "0x2::sui::SUI"]
         }
         
-        response = requests.post(SUI_RPC_URL, json=payload)
-        data = response.json()
+        data = await _post_rpc(session, payload)
         
-        if "result" in data and "data" in data["result"]:
-            sui_balance = 0
-            
-            # Find SUI coins and sum their balances
-            for coin in data["result"]["data"]:
-                if coin["coinType"] == "0x2::sui::SUI":
-                    sui_balance += int(coin["balance"])
-            
-            # Get SUI price
-            token_prices = await get_token_prices()
-            sui_price = token_prices.get("0x2::sui::SUI", 0)
-            sui_value_usd = (sui_balance / 1_000_000_000) * sui_price
+        if "result" in data:
+            sui_price = prices.get("0x2::sui::SUI", 0)
+            balance = int(data["result"]["totalBalance"]) / 1_000_000_000
+            sui_value_usd = balance * sui_price
             
             return {
                 "coin": "SUI",
-                "balance": sui_balance / 1_000_000_000,  # Convert from MIST to SUI
+                "balance": balance,
                 "value_usd": sui_value_usd,
                 "error": None
             }
         else:
-            # Fallback to getBalance if getAllCoins fails
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "suix_getBalance",
-                "params": [wallet_address, "0x2::sui::SUI"]
-            }
-            
-            response = requests.post(SUI_RPC_URL, json=payload)
-            data = response.json()
-            
-            if "result" in data:
-                # Get SUI price
-                token_prices = await get_token_prices()
-                sui_price = token_prices.get("0x2::sui::SUI", 0)
-                balance = int(data["result"]["totalBalance"]) / 1_000_000_000
-                sui_value_usd = balance * sui_price
-                
-                return {
-                    "coin": "SUI",
-                    "balance": balance,
-                    "value_usd": sui_value_usd,
-                    "error": None
-                }
-            else:
-                return {"error": "Failed to fetch balance", "data": data}
+            return {"error": "Failed to fetch balance", "data": data}
     except Exception as e:
         return {"error": f"Error fetching balance: {str(e)}"}
 
-# Function to fetch wallet's owned objects (tokens)
-async def get_wallet_tokens(wallet_address):
-    try:
-        all_tokens = {}
-        cursor = None
-        total_count = 0
-        total_value_usd = 0
-        
-        # Get token prices
-        token_prices = await get_token_prices()
-        
-        # Get all coins first
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "suix_getAllCoins",
-            "params": [wallet_address, None, 100]
-        }
-        
-        response = requests.post(SUI_RPC_URL, json=payload)
-        data = response.json()
+# Summarize the SUI balance from the per-type buckets built by _summarize_tokens
+def _summarize_balance(tokens):
+    sui = tokens.get("0x2::sui::SUI")
+    
+    return {
+        "coin": "SUI",
+        "balance": sui["balance_formatted"] if sui else 0,
+        "value_usd": sui["value_usd"] if sui else 0,
+        "error": None
+    }
+
+# Summarize token holdings from already fetched coins and objects
+def _summarize_tokens(coins, objects, prices):
+    all_tokens = {}
+    total_count = 0
+    total_value_usd = 0
+    
+    # Sum raw integer balances per coin type; conversion happens once per type below
+    for coin in coins:
+        full_type = coin["coinType"]
+        bucket = all_tokens.get(full_type)
+        if bucket is None:
+            bucket = all_tokens[full_type] = {
+                "name": full_type.split("::")[-1],
+                "count": 0,
+                "balance": 0,
+                "balance_formatted": 0,
+                "value_usd": 0
+            }
         
-        if "result" in data and "data" in data["result"]:
-            for coin in data["result"]["data"]:
-                token_type = coin["coinType"].split("::")[-1]
-                full_type = coin["coinType"]
-                balance = int(coin["balance"])
-                
-                # Calculate USD value if price is available
-                token_price = token_prices.get(full_type, 0)
-                if full_type == "0x2::sui::SUI":
-                    value_usd = (balance / 1_000_000_000) * token_price
-                    balance_formatted = balance / 1_000_000_000  # Convert MIST to SUI
-                else:
-                    value_usd = 0  # For other tokens, we'd need their specific conversion rates
-                    balance_formatted = balance
+        bucket["count"] += 1
+        bucket["balance"] += int(coin["balance"])
+    
+    # Convert to display units and calculate USD value if price is available
+    for full_type, bucket in all_tokens.items():
+        divisor = COIN_DIVISORS.get(full_type)
+        if divisor:
+            bucket["balance_formatted"] = bucket["balance"] / divisor
+            bucket["value_usd"] = bucket["balance_formatted"] * prices.get(full_type, 0)
+            total_value_usd += bucket["value_usd"]
+        else:
+            # For other tokens, we'd need their specific conversion rates
+            bucket["balance_formatted"] = bucket["balance"]
+    
+    total_count += len(coins)
+    
+    for obj in objects:
+        # Entries the node couldn't load come back as {"error": ...} with no data
+        obj_data = obj.get("data") or {}
+        if "type" in obj_data:
+            obj_type = obj_data["type"]
+            
+            # Skip coins as we already processed them
+            if "::coin::Coin<" in obj_type:
+                continue
                 
-                if full_type not in all_tokens:
-                    all_tokens[full_type] = {
+            # Drop generic parameters first so "pkg::mod::Name<T>" yields "Name"
+            base_type, _, _ = obj_type.partition("<")
+            _, separator, token_type = base_type.rpartition("::")
+            if separator:
+                if obj_type not in all_tokens:
+                    all_tokens[obj_type] = {
                         "name": token_type,
                         "count": 0,
-                        "balance": 0,
-                        "balance_formatted": 0,
-                        "value_usd": 0
+                        "balance": None,  # Not a coin, so no balance
+                        "balance_formatted": None,
+                        "value_usd": 0  # NFTs would need price lookup
                     }
                 
-                all_tokens[full_type]["count"] += 1
-                all_tokens[full_type]["balance"] += balance
-                all_tokens[full_type]["balance_formatted"] += balance_formatted
-                all_tokens[full_type]["value_usd"] += value_usd
-                total_value_usd += value_usd
-            
-            total_count += len(data["result"]["data"])
-        
-        # Also get NFTs and other objects
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "suix_getOwnedObjects",
-            "params": [wallet_address, None, None, 50]
-        }
+                all_tokens[obj_type]["count"] += 1
+                total_count += 1
+    
+    return {
+        "tokens": all_tokens, 
+        "count": total_count, 
+        "total_value_usd": total_value_usd,
+        # A listing that reached the page cap may have more items the node never sent
+        "truncated": len(coins) >= RPC_LISTING_CAP or len(objects) >= RPC_LISTING_CAP,
+        "error": None
+    }
+
+# Function to fetch wallet balance
+async def get_wallet_balance(session, wallet_address, prices):
+    # suix_getBalance aggregates on the node, so it is a single small RPC
+    balance_data = await _fetch_sui_balance(session, wallet_address, prices)
+    if not balance_data.get("error"):
+        return balance_data
+    
+    try:
+        # Fallback to summing the wallet's SUI coin objects
+        coins = await _fetch_all_pages(
+            session, "suix_getCoins", [wallet_address, "0x2::sui::SUI", None, RPC_PAGE_LIMIT], 2
+        )
+        if coins is None:
+            return balance_data
         
-        response = requests.post(SUI_RPC_URL, json=payload)
-        data = response.json()
+        sui_balance = sum(int(coin["balance"]) for coin in coins) / 1_000_000_000
         
-        if "result" in data and "data" in data["result"]:
-            for obj in data["result"]["data"]:
-                if "type" in obj["data"]:
-                    obj_type = obj["data"]["type"]
-                    
-                    # Skip coins as we already processed them
-                    if "::coin::Coin<" in obj_type:
-                        continue
-                        
-                    type_parts = obj_type.split("::")
-                    if len(type_parts) > 1:
-                        token_type = type_parts[-1]
-                        if "<" in token_type:
-                            token_type = token_type.split("<")[0]
-                        
-                        if obj_type not in all_tokens:
-                            all_tokens[obj_type] = {
-                                "name": token_type,
-                                "count": 0,
-                                "balance": None,  # Not a coin, so no balance
-                                "balance_formatted": None,
-                                "value_usd": 0  # NFTs would need price lookup
-                            }
-                        
-                        all_tokens[obj_type]["count"] += 1
-                        total_count += 1
-            
         return {
-            "tokens": all_tokens, 
-            "count": total_count, 
-            "total_value_usd": total_value_usd,
+            "coin": "SUI",
+            "balance": sui_balance,
+            "value_usd": sui_balance * prices.get("0x2::sui::SUI", 0),
             "error": None
         }
+    except Exception as e:
+        return {"error": f"Error fetching balance: {str(e)}"}
+
+# Function to fetch wallet's owned objects (tokens)
+async def get_wallet_tokens(session, wallet_address, prices):
+    try:
+        # Get all coins and NFTs/other objects together
+        coins, objects = await asyncio.gather(
+            _fetch_coins(session, wallet_address),
+            _fetch_owned_objects(session, wallet_address)
+        )
+        
+        if coins is None or objects is None:
+            return {"error": "Error fetching tokens: the Sui node did not return the full listing"}
+        
+        return _summarize_tokens(coins, objects, prices)
     except Exception as e:
         return {"error": f"Error fetching tokens: {str(e)}"}
 
 # Function to fetch wallet activity
-async def get_wallet_activity(wallet_address):
+async def get_wallet_activity(session, wallet_address):
+    return await _cached(
+        _ACTIVITY_CACHE,
+        ("activity", wallet_address),
+        lambda: cache_aside(
+            f"sui:activity:{wallet_address}",
+            ACTIVITY_REDIS_TTL,
+            lambda: _query_wallet_activity(session, wallet_address)
+        )
+    )
+
+async def _query_wallet_activity(session, wallet_address):
     try:
         # Try getting transactions sent from this address
         from_payload = {
@@ -234,9 +534,6 @@ async def get_wallet_activity(wallet_address):
             ]
         }
         
-        from_response = requests.post(SUI_RPC_URL, json=from_payload)
-        from_data = from_response.json()
-        
         # Also try getting transactions to this address
         to_payload = {
             "jsonrpc": "2.0",
@@ -249,8 +546,16 @@ async def get_wallet_activity(wallet_address):
             ]
         }
         
-        to_response = requests.post(SUI_RPC_URL, json=to_payload)
-        to_data = to_response.json()
+        # Both directions are independent, so query them concurrently
+        from_data, to_data = await asyncio.gather(
+            _post_rpc(session, from_payload),
+            _post_rpc(session, to_payload)
+        )
+        
+        # Don't report a failed lookup as an inactive wallet
+        for data in (from_data, to_data):
+            if "error" in data:
+                return {"error": f"Error fetching activity: {data['error'].get('message', 'RPC error')}"}
         
         from_count = 0
         to_count = 0
@@ -264,15 +569,7 @@ async def get_wallet_activity(wallet_address):
         total_txs = from_count + to_count
         
         # Determine activity level based on transaction count
-        # Updated logic based on your requirements
-        if total_txs == 0:
-            activity_level = "Inactive"
-        elif total_txs < 10:
-            activity_level = "Low"
-        elif total_txs < 50:
-            activity_level = "Moderate"
-        else:
-            activity_level = "High"
+        activity_level = ACTIVITY_LEVELS[_tx_level(total_txs)]
         
         return {
             "outgoing_txs":from_count,
@@ -284,110 +581,103 @@ async def get_wallet_activity(wallet_address):
     except Exception as e:
         return {"error": f"Error fetching activity: {str(e)}"}
 
-# Help command handler
+# Static help message and keyboard, built once at import time
+HELP_TEXT = (
+    "📚 *NeptuneSui Onchain Bot - Help Guide* 📚\n\n"
+    "*Available Commands:*\n\n"
+    "🔹 `/check <address>`\n"
+    "   Get a complete overview of your wallet\n"
+    "   Shows balance, activity level, and token count\n\n"
+    "🔹 `/token <address>(development almost complete)`\n"
+    "   View detailed token holdings\n"
+    "   Displays coins, NFTs, and estimated values\n\n"
+    "🔹 `/token_info <token_address>(STILL IN DEVELOPMENT)`\n"
+    "   Analyze a specific token contract\n"
+    "   Shows supply, holders, and activity metrics\n\n"
+    "🔹 `/help`\n"
+    "   Shows this help message\n\n"
+    "*Examples:*\n"
+    "• `/check 0x1234...abcd`\n"
+    "• `/token 0x1234...abcd`\n"
+    "• `/token_info 0x2::sui::SUI`"
+)
 
-async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    help_message = (
-        "📚 *NeptuneSui Onchain Bot - Help Guide* 📚\n\n"
-        "*Available Commands:*\n\n"
-        "🔹 `/check <address>`\n"
-        "   Get a complete overview of your wallet\n"
-        "   Shows balance, activity level, and token count\n\n"
-        "🔹 `/token <address>(development almost complete)`\n"
-        "   View detailed token holdings\n"
-        "   Displays coins, NFTs, and estimated values\n\n"
-        "🔹 `/token_info <token_address>(STILL IN DEVELOPMENT)`\n"
-        "   Analyze a specific token contract\n"
-        "   Shows supply, holders, and activity metrics\n\n"
-        "🔹 `/help`\n"
-        "   Shows this help message\n\n"
-        "*Examples:*\n"
-        "• `/check 0x1234...abcd`\n"
-        "• `/token 0x1234...abcd`\n"
-        "• `/token_info 0x2::sui::SUI`"
-    )
-    
-    keyboard = [
-        [
-            InlineKeyboardButton("🔍 Check Wallet", url="https://suiscan.xyz/"),
-            InlineKeyboardButton("🪙 View Tokens", url="https://suiscan.xyz/")
-        ]
+HELP_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("🔍 Check Wallet", url="https://suiscan.xyz/"),
+        InlineKeyboardButton("🪙 View Tokens", url="https://suiscan.xyz/")
     ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    
-    await update.message.reply_text(help_message, parse_mode='Markdown', reply_markup=reply_markup)
+])
+
+# Static welcome message and keyboard with useful links
+WELCOME_TEXT = (
+    "🌟 *Welcome to Neptune Sui Onchain Bot!* 🧜‍♂️\n\n"
+    "Get Onchain information for Sui wallet address, tokens, and activity with ease!\n\n"
+    "📱 *Available Commands:*\n"
+    "• `/check <address>` - Get wallet overview and stats\n"
+    "• `/token <address>` - See detailed token holdings\n"
+    "• `/token_info <token_address>` - Analyze token contracts\n"
+    "• `/help` - Display this help message\n\n"
+    "🔍 *Try it now:* Send `/check` followed by your Sui wallet address\n"
+    "Example: `/check 0x123abc...`\n\n"
+    "The `/token_info` command isnt working ATM❌ and the dollar value of memecoins other than sui might not be correct, everything will be fixed before Wednesday and bot will be fully functional 🧜‍♂️\n\n"
+    "Join our community @neptunesui"
+)
+
+WELCOME_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("✨ Visit Sui Explorer", url="https://suiscan.xyz/"),
+        InlineKeyboardButton("📚 Sui Official", url="https://sui.io/")
+    ]
+])
+
+# Wallet overview template; each section ends with its own newline
+CHECK_WALLET_TEMPLATE = (
+    "📊 *SUI WALLET ANALYSIS* 📊\n"
+    "━━━━━━━━━━━━━━━━━━━━━\n"
+    "*Address:* `{address_short}`\n\n"
+    "{balance_section}\n"
+    "{activity_section}\n"
+    "{tokens_section}"
+    "\n━━━━━━━━━━━━━━━━━━━━━\n"
+    "Use `/token {wallet_address}` for detailed token breakdown"
+)
+
+# Help command handler
+async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    await update.message.reply_text(HELP_TEXT, parse_mode='Markdown', reply_markup=HELP_MARKUP)
 
 # Updated Start command handler
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    # Create a more visually appealing welcome message
-    welcome_message = (
-        "🌟 *Welcome to Neptune Sui Onchain Bot!* 🧜‍♂️\n\n"
-        "Get Onchain information for Sui wallet address, tokens, and activity with ease!\n\n"
-        "📱 *Available Commands:*\n"
-        "• `/check <address>` - Get wallet overview and stats\n"
-        "• `/token <address>` - See detailed token holdings\n"
-        "• `/token_info <token_address>` - Analyze token contracts\n"
-        "• `/help` - Display this help message\n\n"
-        "🔍 *Try it now:* Send `/check` followed by your Sui wallet address\n"
-        "Example: `/check 0x123abc...`\n\n"
-        "The `/token_info` command isnt working ATM❌ and the dollar value of memecoins other than sui might not be correct, everything will be fixed before Wednesday and bot will be fully functional 🧜‍♂️\n\n"
-        "Join our community @neptunesui"
-    )
-    
-    # Create keyboard with useful links
-    keyboard = [
-        [
-            InlineKeyboardButton("✨ Visit Sui Explorer", url="https://suiscan.xyz/"),
-            InlineKeyboardButton("📚 Sui Official", url="https://sui.io/")
-        ]
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    
-    await update.message.reply_text(welcome_message, parse_mode='Markdown', reply_markup=reply_markup)
-    
+    await update.message.reply_text(WELCOME_TEXT, parse_mode='Markdown', reply_markup=WELCOME_MARKUP)
+    
+# Activity levels in increasing order; the helpers below return an index into this tuple
+ACTIVITY_LEVELS = ("Inactive", "Low", "Moderate", "High")
+ACTIVITY_EMOJI = {
+    "Inactive": "⚪",
+    "Low": "🟠",
+    "Moderate": "🟢",
+    "High": "🟢🟢"
+}
+
+# Lower bounds of the Low/Moderate/High levels; bisect_right maps a count straight to its level index
+TX_LEVEL_BOUNDS = (1, 10, 50)
+TOKEN_LEVEL_BOUNDS = (1, 5, 20)
+
+def _tx_level(transaction_count):
+    return bisect.bisect_right(TX_LEVEL_BOUNDS, transaction_count)
+
+def _token_level(token_count):
+    return bisect.bisect_right(TOKEN_LEVEL_BOUNDS, token_count)
+
 # Determine activity level based on both transactions and token count
 def determine_activity_level(transaction_count, token_count):
-    # Transaction-based activity
-    if transaction_count == 0:
-        tx_activity = "Inactive"
-    elif transaction_count < 10:
-        tx_activity = "Low"
-    elif transaction_count < 50:
-        tx_activity = "Moderate"
-    else:
-        tx_activity = "High"
-    
-    # Token-based activity
-    if token_count == 0:
-        token_activity = "Inactive"
-    elif token_count < 5:
-        token_activity = "Low"
-    elif token_count < 20:
-        token_activity = "Moderate"
-    else:
-        token_activity = "High"
-    
     # Combine both metrics - prioritize the higher activity level
-    activity_levels = {"Inactive": 0, "Low": 1, "Moderate": 2, "High": 3}
-    
-    tx_level = activity_levels[tx_activity]
-    token_level = activity_levels[token_activity]
-    
-    combined_level = max(tx_level, token_level)
-    
-    # Convert back to string
-    activity_mapping = {0: "Inactive", 1: "Low", 2: "Normal", 3: "Moderate"}
-    return activity_mapping[combined_level]
+    return ACTIVITY_LEVELS[max(_tx_level(transaction_count), _token_level(token_count))]
 
 # Get activity emoji based on level
 def get_activity_emoji(level):
-    emoji_map = {
-        "Inactive": "⚪",
-        "Low": "🟠",
-        "Normal": "🟢",
-        "Moderate": "🟢🟢"
-    }
-    return emoji_map.get(level, "⚪")
+    return ACTIVITY_EMOJI.get(level, "⚪")
 
 # Check wallet stats
 async def check_wallet(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -404,10 +694,10 @@ async def check_wallet(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     wallet_address = context.args[0]
     
     # Validate address format
-    if not wallet_address.startswith("0x") or len(wallet_address) < 10:
+    if not SUI_ADDRESS_RE.fullmatch(wallet_address):
         await update.message.reply_text(
             "❌ *Invalid Sui wallet address format*\n\n"
-            "Make sure your address starts with '0x' and is the correct length.\n"
+            "Make sure your address starts with '0x' followed by 64 hex characters.\n"
             "Try again with a valid address.",
             parse_mode='Markdown'
         )
@@ -417,9 +707,43 @@ async def check_wallet(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     await update.message.reply_text(f"🔍 Checking wallet {wallet_address}...")
     
     # Fetch wallet data
-    balance_data = await get_wallet_balance(wallet_address)
-    activity_data = await get_wallet_activity(wallet_address)
-    tokens_data = await get_wallet_tokens(wallet_address)
+    session = context.bot_data["http"]
+    coins, objects, prices, activity_data = await asyncio.gather(
+        _fetch_coins(session, wallet_address),
+        _fetch_owned_objects(session, wallet_address),
+        get_token_prices(session),
+        get_wallet_activity(session, wallet_address),
+        return_exceptions=True
+    )
+    
+    # Turn any unexpected exception into the error dict the formatting below expects
+    if isinstance(prices, Exception):
+        prices = {}
+    if isinstance(activity_data, Exception):
+        activity_data = {"error": f"Error fetching activity: {str(activity_data)}"}
+    
+    # Derive token summary and balance from the same coin list; None means the listing could not be fetched in full
+    coins_ok = isinstance(coins, list)
+    objects_ok = isinstance(objects, list)
+    try:
+        tokens_summary = _summarize_tokens(coins if coins_ok else [], objects if objects_ok else [], prices)
+    except Exception as e:
+        logger.error(f"Error summarizing tokens: {str(e)}")
+        tokens_summary = {"error": f"Error fetching tokens: {str(e)}"}
+    
+    # The SUI balance is the aggregated SUI bucket; ask the node (getBalance, then getCoins) if the coin list
+    # failed or stopped at the page cap, since a truncated list would understate the balance
+    if coins_ok and not tokens_summary.get("error") and not tokens_summary.get("truncated"):
+        balance_data = _summarize_balance(tokens_summary["tokens"])
+    else:
+        balance_data = await get_wallet_balance(session, wallet_address, prices)
+    
+    if not coins_ok or not objects_ok:
+        error = coins if not coins_ok else objects
+        reason = str(error) if isinstance(error, Exception) else "the Sui node did not return the full listing"
+        tokens_data = {"error": f"Error fetching tokens: {reason}"}
+    else:
+        tokens_data = tokens_summary
     
     # Determine combined activity level
     token_count = tokens_data.get("count", 0) if not tokens_data.get("error") else 0
@@ -444,49 +768,84 @@ async def check_wallet(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     ]
     reply_markup = InlineKeyboardMarkup(keyboard)
     
-    # Format response
-    response = f"📊 *SUI WALLET ANALYSIS* 📊\n"
-    response += f"━━━━━━━━━━━━━━━━━━━━━\n"
-    response += f"*Address:* `{wallet_address[:6]}...{wallet_address[-4:]}`\n\n"
-    
     # Add balance information
     if balance_data.get("error"):
-        response += f"💰 *Balance:* Unable to fetch balance\n"
+        balance_section = "💰 *Balance:* Unable to fetch balance\n"
     else:
         sui_value = balance_data.get("value_usd", 0)
-        response += f"💰 *Balance:* {balance_data['balance']:.6f} SUI\n"
-        response += f"💵 *Value:* ${sui_value:.2f} USD\n"
-    
-    response += f"\n"
+        balance_section = (
+            f"💰 *Balance:* {balance_data['balance']:.6f} SUI\n"
+            f"💵 *Value:* ${sui_value:.2f} USD\n"
+        )
     
     # Add activity information
     if activity_data.get("error") and "No transactions found" not in activity_data.get("error", ""):
-        response += f"🔄 *Activity:* Unable to fetch activity\n"
+        activity_section = "🔄 *Activity:* Unable to fetch activity\n"
     else:
         in_txs = activity_data.get("incoming_txs", 0)
         out_txs = activity_data.get("outgoing_txs", 0)
-        total_txs = activity_data.get("recent_transactions", 0)
         
-        response += f"🔄 *Activity Level:* {activity_emoji} {activity_level}\n"
-        response += f"📥 *Incoming:* {in_txs} transactions\n"
-        response += f"📤 *Outgoing:* {out_txs} transactions\n"
-    
-    response += f"\n"
+        activity_section = (
+            f"🔄 *Activity Level:* {activity_emoji} {activity_level}\n"
+            f"📥 *Incoming:* {in_txs} transactions\n"
+            f"📤 *Outgoing:* {out_txs} transactions\n"
+        )
     
     # Add token information
     if tokens_data.get("error"):
-        response += f"🪙 *Tokens:* Unable to fetch tokens\n"
+        tokens_section = "🪙 *Tokens:* Unable to fetch tokens\n"
     else:
         total_value = tokens_data.get("total_value_usd", 0)
-        response += f"🪙 *Total Tokens:* {tokens_data['count']} tokens/objects\n"
-        response += f"💵 *Portfolio Value:* ${total_value:.2f} USD\n"
+        tokens_section = (
+            f"🪙 *Total Tokens:* {tokens_data['count']} tokens/objects\n"
+            f"💵 *Portfolio Value:* ${total_value:.2f} USD\n"
+        )
+        if tokens_data.get("truncated"):
+            tokens_section += TRUNCATED_NOTE
     
-    response += f"\n━━━━━━━━━━━━━━━━━━━━━\n"
-    response += f"Use `/token {wallet_address}` for detailed token breakdown"
+    # Format response
+    response = CHECK_WALLET_TEMPLATE.format(
+        address_short=_short(wallet_address, 6),
+        balance_section=balance_section,
+        activity_section=activity_section,
+        tokens_section=tokens_section,
+        wallet_address=wallet_address
+    )
     
     # Send the final response
     await update.message.reply_text(response, parse_mode='Markdown', reply_markup=reply_markup)
 
+# Shorten an address to its first and last few characters for display
+def _short(address, head=8, tail=4):
+    return f"{address[:head]}...{address[-tail:]}"
+
+# Split a long Markdown message into chunks of whole lines so entities like *bold* are never cut
+# The limit leaves room under Telegram's 4096 character cap for the "Continued" header
+def _split_message(text, limit=3900):
+    chunks = []
+    current = []
+    current_len = 0
+    
+    for line in text.split("\n"):
+        # A single line longer than the limit has to be cut; this only happens with huge token names
+        while len(line) > limit:
+            if current:
+                chunks.append("\n".join(current))
+                current, current_len = [], 0
+            chunks.append(line[:limit])
+            line = line[limit:]
+        
+        if current and current_len + len(line) + 1 > limit:
+            chunks.append("\n".join(current))
+            current, current_len = [], 0
+        
+        current.append(line)
+        current_len += len(line) + 1
+    
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
 # Token command handler
 async def token_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     # Get wallet address from command arguments
@@ -502,10 +861,10 @@ async def token_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     wallet_address = context.args[0]
     
     # Validate address format
-    if not wallet_address.startswith("0x") or len(wallet_address) < 10:
+    if not SUI_ADDRESS_RE.fullmatch(wallet_address):
         await update.message.reply_text(
             "❌ *Invalid Sui wallet address format*\n\n"
-            "Make sure your address starts with '0x' and is the correct length.\n"
+            "Make sure your address starts with '0x' followed by 64 hex characters.\n"
             "Try again with a valid address.",
             parse_mode='Markdown'
         )
@@ -515,7 +874,9 @@ async def token_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     await update.message.reply_text(f"🔍 Fetching tokens for {wallet_address}...")
     
     # Fetch wallet tokens
-    tokens_data = await get_wallet_tokens(wallet_address)
+    session = context.bot_data["http"]
+    prices = await get_token_prices(session)
+    tokens_data = await get_wallet_tokens(session, wallet_address, prices)
     
     # Build explorer links
     suiscan_link = f"{SUISCAN_URL}{wallet_address}"
@@ -549,12 +910,16 @@ async def token_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         )
         return
     
-    # Format token list
+    # Format token list; fragments are collected and joined once at the end
     total_value_usd = tokens_data.get("total_value_usd", 0)
-    response = f"🪙 *TOKEN HOLDINGS* 🪙\n"
-    response += f"━━━━━━━━━━━━━━━━━━━━━\n"
-    response += f"*Address:* `{wallet_address[:6]}...{wallet_address[-4:]}`\n"
-    response += f"💵 *Total Value:* ${total_value_usd:.2f} USD\n\n"
+    parts = [
+        "🪙 *TOKEN HOLDINGS* 🪙\n",
+        "━━━━━━━━━━━━━━━━━━━━━\n",
+        f"*Address:* `{_short(wallet_address, 6)}`\n",
+        f"💵 *Total Value:* ${total_value_usd:.2f} USD\n\n"
+    ]
+    if tokens_data.get("truncated"):
+        parts.append(TRUNCATED_NOTE + "\n")
     
     # Process and sort tokens
     coin_tokens = []
@@ -570,53 +935,114 @@ async def token_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
             if token_type == "0x2::sui::SUI":
                 balance_str = f"{token_balance:.6f}"
                 value_str = f"${token_value:.2f}"
-                coin_tokens.append(f"🔸 *{token_name}*: {balance_str} ({value_str})")
+                coin_tokens.append(f"🔸 *{token_name}*: {balance_str} ({value_str})\n")
             else:
                 balance_str = f"{token_balance}"
                 value_str = f"${token_value:.2f}" if token_value > 0 else "N/A"
-                coin_tokens.append(f"🔹 *{token_name}*: {balance_str} ({value_str})")
+                coin_tokens.append(f"🔹 *{token_name}*: {balance_str} ({value_str})\n")
         else:  # This is an NFT or other object
-            nft_tokens.append(f"🔶 *{token_name}*: {token_count} objects")
+            nft_tokens.append(f"🔶 *{token_name}*: {token_count} objects\n")
     
     # Add coins first
     if coin_tokens:
-        response += "*Coins:*\n" + "\n".join(coin_tokens) + "\n\n"
+        parts.append("*Coins:*\n")
+        parts.extend(coin_tokens)
+        parts.append("\n")
     
     # Then add NFTs/other objects
     if nft_tokens:
-        response += "*Other Objects:*\n" + "\n".join(nft_tokens)
-    
-    response += f"\n\n━━━━━━━━━━━━━━━━━━━━━\n"
-    response += f"Use `/check {wallet_address}` for wallet overview"
-    
-    # If the message is too long, split it
-    if len(response) > 4000:
-        chunks = [response[i:i+4000] for i in range(0, len(response), 4000)]
-        for i, chunk in enumerate(chunks):
-            if i == 0:
-                await update.message.reply_text(
-                    chunk, 
-                    parse_mode='Markdown', 
-                    reply_markup=reply_markup if i == 0 else None
-                )
-            else:
-                await update.message.reply_text(
-                    f"*Continued ({i+1}/{len(chunks)})*\n\n{chunk}", 
-                    parse_mode='Markdown'
-                )
-    else:
-        await update.message.reply_text(response, parse_mode='Markdown', reply_markup=reply_markup)
+        parts.append("*Other Objects:*\n")
+        parts.extend(nft_tokens)
+    
+    parts.append("\n━━━━━━━━━━━━━━━━━━━━━\n")
+    parts.append(f"Use `/check {wallet_address}` for wallet overview")
+    response = "".join(parts)
+    
+    # If the message is too long, split it on line boundaries
+    # Chunks are sent in order so the continuation numbering reads correctly
+    chunks = _split_message(response)
+    for i, chunk in enumerate(chunks):
+        if i == 0:
+            await update.message.reply_text(
+                chunk, 
+                parse_mode='Markdown', 
+                reply_markup=reply_markup
+            )
+        else:
+            await update.message.reply_text(
+                f"*Continued ({i+1}/{len(chunks)})*\n\n{chunk}", 
+                parse_mode='Markdown'
+            )
+
+# Token analysis handed to the command handlers; the caches keep the raw dicts so they stay JSON-friendly for Redis
+@dataclass(slots=True)
+class TokenInfo:
+    address: str
+    type: str = "Unknown"
+    owner: object = "Unknown"
+    package: str | None = None
+    module: str | None = None
+    name: str | None = None
+    symbol: str | None = None
+    decimals: int | None = None
+    supply: float | None = None
+    description: str | None = None
+    creation_tx: str | None = None
+    deployer: str | None = None
+    deploy_ts: float | None = None
+    deploy_date: str | None = None
+    deploy_time: str | None = None
+    first_buyers: list = field(default_factory=list)
+    estimated_holders: int | str | None = None
+    transaction_count: int | None = None
+    activity_level: str | None = None
+    recent_events: int | None = None
+    error: str | None = None
+
+_TOKEN_INFO_FIELDS = frozenset(f.name for f in fields(TokenInfo))
 
 # Function to analyze Sui token contracts
-async def get_token_contract_info(token_address):
+# Static facts (type, metadata, deployer) are cached for an hour, recent activity for 30 seconds
+async def get_token_contract_info(session, token_address):
+    static_info = await _cached(
+        _TOKEN_STATIC_CACHE,
+        ("token_static", token_address),
+        lambda: cache_aside(
+            f"sui:tokinfo:{token_address}",
+            TOKEN_INFO_REDIS_TTL,
+            lambda: _query_token_static_info(session, token_address)
+        )
+    )
+    if static_info.get("error"):
+        return TokenInfo(address=token_address, error=static_info["error"])
+    
+    activity_info = await _cached(
+        _TOKEN_ACTIVITY_CACHE,
+        ("token_activity", token_address),
+        lambda: cache_aside(
+            f"sui:tokact:{token_address}",
+            TOKEN_ACTIVITY_REDIS_TTL,
+            lambda: _query_token_activity(session, token_address, static_info)
+        )
+    )
+    
+    # first_buyers is the only container callers could change, so copy it off the cached entry;
+    # unknown keys from an older Redis entry are dropped rather than breaking the constructor
+    merged = {**static_info, **activity_info}
+    token_info = TokenInfo(**{key: value for key, value in merged.items() if key in _TOKEN_INFO_FIELDS})
+    token_info.first_buyers = list(token_info.first_buyers)
+    return token_info
+
+# Function to fetch the slowly changing parts of a token: object, metadata and deployer
+async def _query_token_static_info(session, token_address):
     try:
         # Get token object data
-        payload = {
+        object_payload = {
             "jsonrpc": "2.0",
             "id": 1,
             "method": "sui_getObject",
             "params": [token_address, {
-                "showContent": True,
+                # Only the sections read below; showContent can dwarf everything else
                 "showDisplay": True,
                 "showOwner": True,
                 "showType": True,
@@ -624,8 +1050,19 @@ async def get_token_contract_info(token_address):
             }]
         }
         
-        response = requests.post(SUI_RPC_URL, json=payload)
-        data = response.json()
+        # Get coin metadata if available; only used when the object turns out to be a coin
+        metadata_payload = {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "method": "suix_getCoinMetadata",
+            "params": [token_address]
+        }
+        
+        # First round: everything that only needs the token address
+        data, metadata_data = await _post_rpc_many(session, [object_payload, metadata_payload])
+        
+        if isinstance(data, Exception):
+            raise data
         
         if "error" in data:
             return {"error": f"Error: {data['error']['message']}"}
@@ -647,7 +1084,6 @@ async def get_token_contract_info(token_address):
             "description": None,
             "creation_tx": object_data.get("previousTransaction", None),
             "deployer": None,
-            "first_buyers": [],
             "error": None
         }
         
@@ -667,18 +1103,8 @@ async def get_token_contract_info(token_address):
         
         # Get additional token details if it's a coin
         if "coin" in token_info["type"].lower() or "token" in token_info["type"].lower():
-            # Try to get total supply
             try:
-                # Get coin metadata if available
-                metadata_payload = {
-                    "jsonrpc": "2.0",
-                    "id": 2,
-                    "method": "suix_getCoinMetadata",
-                    "params": [token_address]
-                }
-                
-                metadata_response = requests.post(SUI_RPC_URL, json=metadata_payload)
-                metadata_data = metadata_response.json()
+                _raise_for_rpc_error(metadata_data)
                 
                 if "result" in metadata_data and metadata_data["result"]:
                     metadata = metadata_data["result"]
@@ -692,30 +1118,7 @@ async def get_token_contract_info(token_address):
                         token_info["supply"] = raw_supply / (10 ** token_info["decimals"])
             except Exception as e:
                 logger.error(f"Error fetching token metadata: {str(e)}")
-        
-        # Get token events
-        try:
-            events_payload = {
-                "jsonrpc": "2.0",
-                "id": 3,
-                "method": "suix_queryEvents",
-                "params": [
-                    {"MoveEventModule": token_info["module"] if token_info["module"] else ""},
-                    {"limit": 10, "descendingOrder": True},
-                    None
-                ]
-            }
-            
-            events_response = requests.post(SUI_RPC_URL, json=events_payload)
-            events_data = events_response.json()
-            
-            if "result" in events_data and "data" in events_data["result"]:
-                token_info["recent_events"] = len(events_data["result"]["data"])
-            else:
-                token_info["recent_events"] = 0
-        except Exception as e:
-            logger.error(f"Error fetching token events: {str(e)}")
-            token_info["recent_events"] = 0
+                token_info["partial"] = True
         
         # Get creation transaction and deployer info
         if token_info["creation_tx"]:
@@ -728,96 +1131,253 @@ async def get_token_contract_info(token_address):
                     "params": [
                         token_info["creation_tx"],
                         {
-                            "showEffects": True,
-                            "showInput": True,
-                            "showEvents": True
+                            # The sender lives in the transaction input; timestampMs is always returned
+                            "showInput": True
                         }
                     ]
                 }
                 
-                creation_tx_response = requests.post(SUI_RPC_URL, json=creation_tx_payload)
-                creation_tx_data = creation_tx_response.json()
+                creation_tx_data = await _post_rpc(session, creation_tx_payload)
+                _raise_for_rpc_error(creation_tx_data)
                 
                 if "result" in creation_tx_data:
                     tx_result = creation_tx_data["result"]
                     # Get deployer (sender of creation transaction)
-                    if "sender" in tx_result:
-                        token_info["deployer"] = tx_result["sender"]
+                    sender = tx_result.get("transaction", {}).get("data", {}).get("sender") or tx_result.get("sender")
+                    if sender:
+                        token_info["deployer"] = sender
                     
                     # Additional deploy info
                     if "timestampMs" in tx_result:
-                        deploy_time_ms = int(tx_result["timestampMs"])
+                        deploy_ts = int(tx_result["timestampMs"]) / 1000
+                        # Keep the raw epoch seconds so callers can compute age without reparsing the date
+                        token_info["deploy_ts"] = deploy_ts
                         # Convert to human-readable date
-                        from datetime import datetime
-                        deploy_date = datetime.fromtimestamp(deploy_time_ms / 1000)
+                        deploy_date = datetime.fromtimestamp(deploy_ts, timezone.utc)
                         token_info["deploy_date"] = deploy_date.strftime("%Y-%m-%d")
                         token_info["deploy_time"] = deploy_date.strftime("%H:%M:%S UTC")
             except Exception as e:
                 logger.error(f"Error fetching creation transaction: {str(e)}")
+                token_info["partial"] = True
         
-        # Estimate holder count and activity
-        # Note: This is an approximation as the RPC API doesn't directly provide this
+        return token_info
+    except Exception as e:
+        logger.error(f"Error analyzing token contract: {str(e)}")
+        return {"error": f"Error analyzing token contract: {str(e)}"}
+
+# Function to fetch a token's recent events and interactions
+async def _query_token_activity(session, token_address, static_info):
+    activity_info = {"first_buyers": [], "recent_events": None}
+    
+    # Get token events; objects without a module have no event stream to query
+    events_payload = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "suix_queryEvents",
+        "params": [
+            {"MoveEventModule": static_info["module"]},
+            {"limit": 10, "descendingOrder": True},
+            None
+        ]
+    }
+    
+    # We'll use a proxy to estimate holders - checking how many distinct
+    # addresses have interacted with the token recently
+    interactions_payload = {
+        "jsonrpc": "2.0",
+        "id": 2,
+        "method": "suix_queryTransactionBlocks",
+        "params": [
+            {"InputObject": token_address},
+            {"limit": 100, "descendingOrder": True},
+            None
+        ]
+    }
+    
+    if static_info["module"]:
+        events_data, interactions_data = await _post_rpc_many(session, [events_payload, interactions_payload])
+    else:
+        events_data = None
+        (interactions_data,) = await _post_rpc_many(session, [interactions_payload])
+    
+    # Parse token events
+    if events_data is not None:
         try:
-            # We'll use a proxy to estimate - checking how many distinct addresses 
-            # have interacted with the token recently
-            interactions_payload = {
-                "jsonrpc": "2.0",
-                "id": 4,
-                "method": "suix_queryTransactionBlocks",
-                "params": [
-                    {"InputObject": token_address},
-                    {"limit": 100, "descendingOrder": True},
-                    None
-                ]
-            }
-            
-            interactions_response = requests.post(SUI_RPC_URL, json=interactions_payload)
-            interactions_data = interactions_response.json()
+            _raise_for_rpc_error(events_data)
             
-            unique_addresses = set()
-            first_buyers = []
-            tx_count = 0
+            if "result" in events_data and "data" in events_data["result"]:
+                activity_info["recent_events"] = len(events_data["result"]["data"])
+            else:
+                activity_info["recent_events"] = 0
+        except Exception as e:
+            logger.error(f"Error fetching token events: {str(e)}")
+            activity_info["partial"] = True
+    
+    # Estimate holder count and activity
+    # Note: This is an approximation as the RPC API doesn't directly provide this
+    try:
+        _raise_for_rpc_error(interactions_data)
+        
+        unique_addresses = set()
+        first_buyers = []
+        first_buyers_seen = set()
+        deployer = static_info.get("deployer")
+        tx_count = 0
+        
+        if "result" in interactions_data and "data" in interactions_data["result"]:
+            tx_list = interactions_data["result"]["data"]
+            tx_count = len(tx_list)
             
-            if "result" in interactions_data and "data" in interactions_data["result"]:
-                tx_list = interactions_data["result"]["data"]
-                tx_count = len(tx_list)
-                
-                for tx in tx_list:
-                    if "sender" in tx:
-                        sender = tx["sender"]
-                        unique_addresses.add(sender)
-                        
-                        # Keep track of first few buyers/interactors (excluding deployer)
-                        if sender != token_info.get("deployer") and len(first_buyers) < 3:
-                            if sender not in first_buyers:
-                                first_buyers.append(sender)
-                
-                # Store first buyers
-                token_info["first_buyers"] = first_buyers
+            # Distinct senders approximate the holder count
+            unique_addresses = {tx["sender"] for tx in tx_list if "sender" in tx}
             
-            token_info["estimated_holders"] = len(unique_addresses)
-            token_info["transaction_count"] = tx_count
+            # Keep track of first few buyers/interactors (excluding deployer); stop once we have three
+            for tx in tx_list:
+                sender = tx.get("sender")
+                if sender and sender != deployer and sender not in first_buyers_seen:
+                    first_buyers.append(sender)
+                    first_buyers_seen.add(sender)
+                    if len(first_buyers) == 3:
+                        break
             
-            # Determine activity level
-            if tx_count == 0:
-                token_info["activity_level"] = "Inactive"
-            elif tx_count < 10:
-                token_info["activity_level"] = "Low"
-            elif tx_count < 50:
-                token_info["activity_level"] = "Moderate"
-            else:
-                token_info["activity_level"] = "High"
-                
-        except Exception as e:
-            logger.error(f"Error estimating token holders: {str(e)}")
-            token_info["estimated_holders"] = "Unknown"
-            token_info["transaction_count"] = 0
-            token_info["activity_level"] = "Unknown"
+            # Store first buyers
+            activity_info["first_buyers"] = first_buyers
         
-        return token_info
+        activity_info["estimated_holders"] = len(unique_addresses)
+        activity_info["transaction_count"] = tx_count
+        
+        # Determine activity level
+        activity_info["activity_level"] = ACTIVITY_LEVELS[_tx_level(tx_count)]
+            
     except Exception as e:
-        logger.error(f"Error analyzing token contract: {str(e)}")
-        return {"error": f"Error analyzing token contract: {str(e)}"}
+        logger.error(f"Error estimating token holders: {str(e)}")
+        # Leave the count unset so an RPC failure doesn't read as low volume in the risk assessment
+        activity_info["estimated_holders"] = "Unknown"
+        activity_info["transaction_count"] = None
+        activity_info["activity_level"] = "Unknown"
+        activity_info["partial"] = True
+    
+    return activity_info
+
+# Render the related-address check for the enhanced token report
+def _render_relationship(relationship_info):
+    lines = []
+    if relationship_info and not relationship_info.get("error"):
+        if relationship_info.get("related"):
+            lines.append(f"\n⚠️ *Potential Related Addresses:* Yes\n")
+            lines.append(f"   {relationship_info.get('reason', 'Common transaction patterns detected')}\n")
+        else:
+            lines.append(f"\n✅ *Related Addresses:* No evidence found\n")
+    
+    return lines
+
+# Render the trading analysis for the enhanced token report
+def _render_trading(trading_info):
+    lines = []
+    if trading_info and not trading_info.get("error"):
+        lines.append(f"\n💱 *Trading Analysis:*\n")
+        
+        if trading_info.get("first_liquidity_provider"):
+            lines.append(f"   First LP: `{_short(trading_info['first_liquidity_provider'])}`\n")
+        
+        if trading_info.get("first_liquidity_time"):
+            lines.append(f"   First Liquidity: {trading_info['first_liquidity_time']}\n")
+        
+        if trading_info.get("liquidity_events"):
+            lines.append(f"   Liquidity Events: {trading_info['liquidity_events']}\n")
+        
+        if trading_info.get("transfer_events"):
+            lines.append(f"   Transfer Events: {trading_info['transfer_events']}\n")
+        
+        if trading_info.get("mint_events"):
+            lines.append(f"   Mint Events: {trading_info['mint_events']}\n")
+    
+    return lines
+
+# Edit a progress message, logging instead of raising if it is gone or unchanged
+async def _edit_message_quietly(message, text, **kwargs):
+    try:
+        await message.edit_text(text, **kwargs)
+    except TelegramError as e:
+        logger.warning(f"Could not edit message {message.message_id}: {str(e)}")
+
+# Layout shared by /token_info and /enhanced_token_info; every optional line renders as "" when its field is missing
+TOKEN_INFO_TEMPLATE = (
+    "🪙 *TOKEN ANALYSIS* 🪙\n"
+    "━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "*Token:* {name}{symbol_paren}\n"
+    "*Address:* `{address_short}`\n"
+    "{type_line}{description_line}\n"
+    "{deployer_line}{deploy_date_line}{deploy_time_line}{first_buyers_section}{insights}\n"
+    "{supply_line}{decimals_line}\n"
+    "{activity_line}{transactions_line}{holders_line}{events_line}\n"
+    "{ownership_section}"
+)
+
+# Describe a token's owner as (type, address); the address is None when there is nothing to show
+def _describe_owner(owner):
+    if isinstance(owner, dict):
+        if "AddressOwner" in owner:
+            return "Address", owner["AddressOwner"]
+        if "ObjectOwner" in owner:
+            return "Object", owner["ObjectOwner"]
+        if "Shared" in owner:
+            return "Shared", None
+    return "Unknown", None
+
+# Render the sections shared by /token_info and /enhanced_token_info as message fragments
+def _render_token_common(token_info, token_address, insights=()):
+    name = token_info.name
+    symbol = token_info.symbol
+    deployer = token_info.deployer
+    first_buyers = token_info.first_buyers
+    supply = token_info.supply
+    decimals = token_info.decimals
+    activity_level = token_info.activity_level
+    transaction_count = token_info.transaction_count
+    holders = token_info.estimated_holders
+    recent_events = token_info.recent_events
+    owner = token_info.owner
+    
+    ownership_section = ""
+    if owner and owner != 'Unknown':
+        owner_type, owner_address = _describe_owner(owner)
+        ownership_section = f"👤 *Ownership:* {owner_type}\n"
+        if owner_address:
+            ownership_section += f"📝 *Owner:* `{_short(owner_address, 10)}`\n"
+    
+    values = {
+        "name": name,
+        "symbol_paren": f" ({symbol})" if symbol and symbol != name else "",
+        "address_short": _short(token_address, 10),
+        "type_line": f"*Type:* `{token_info.type}`\n" if token_info.type else "",
+        "description_line": (
+            f"*Description:* {token_info.description}\n"
+            if token_info.description and token_info.description != 'Unknown' else ""
+        ),
+        "deployer_line": f"👨‍💻 *Deployer:* `{_short(deployer)}`\n" if deployer else "",
+        "deploy_date_line": f"📅 *Deployed on:* {token_info.deploy_date}\n" if token_info.deploy_date else "",
+        "deploy_time_line": f"🕒 *Deploy time:* {token_info.deploy_time}\n" if token_info.deploy_time else "",
+        "first_buyers_section": (
+            "\n👥 *First Interactors:*\n"
+            + "".join(f"   {i+1}. `{_short(buyer)}`\n" for i, buyer in enumerate(first_buyers))
+            if first_buyers else ""
+        ),
+        # Sections only the enhanced command adds go between the deployment and supply blocks
+        "insights": "".join(insights),
+        "supply_line": f"💰 *Total Supply:* {supply:,.2f}{' ' + symbol if symbol else ''}\n" if supply is not None else "",
+        "decimals_line": f"🔢 *Decimals:* {decimals}\n" if decimals is not None else "",
+        "activity_line": (
+            f"🔄 *Activity Level:* {get_activity_emoji(activity_level)} {activity_level}\n" if activity_level else ""
+        ),
+        "transactions_line": f"📊 *Recent Transactions:* {transaction_count}\n" if transaction_count is not None else "",
+        "holders_line": f"👥 *Est. Holders:* {holders}\n" if holders is not None and holders != 'Unknown' else "",
+        "events_line": f"📡 *Recent Events:* {recent_events}\n" if recent_events is not None else "",
+        "ownership_section": ownership_section,
+    }
+    
+    return [TOKEN_INFO_TEMPLATE.format_map(values)]
+
 
 # Command handler for token contract analysis
 async def token_info_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -846,11 +1406,11 @@ async def token_info_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     loading_message = await update.message.reply_text(f"🔍 Analyzing token: {token_address}...")
     
     # Get token information
-    token_info = await get_token_contract_info(token_address)
+    token_info = await get_token_contract_info(context.bot_data["http"], token_address)
     
-    if token_info.get("error"):
+    if token_info.error:
         await update.message.reply_text(
-            f"❌ *Error analyzing token*\n\n{token_info['error']}", 
+            f"❌ *Error analyzing token*\n\n{token_info.error}", 
             parse_mode='Markdown'
         )
         return
@@ -869,123 +1429,41 @@ async def token_info_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     reply_markup = InlineKeyboardMarkup(keyboard)
     
     # Format response
-    response = f"🪙 *TOKEN ANALYSIS* 🪙\n"
-    response += f"━━━━━━━━━━━━━━━━━━━━━\n\n"
-    
-    response += f"*Token:* {token_info.get('name', 'Unknown')}"
-    if token_info.get('symbol') and token_info['symbol'] != token_info.get('name', ''):
-        response += f" ({token_info['symbol']})\n"
-    else:
-        response += "\n"
-    
-    response += f"*Address:* `{token_address[:10]}...{token_address[-4:] if len(token_address) > 14 else token_address[-4:]}`\n"
-    
-    if token_info.get('type'):
-        response += f"*Type:* `{token_info['type']}`\n"
+    parts = _render_token_common(token_info, token_address)
     
-    if token_info.get('description') and token_info['description'] != 'Unknown':
-        response += f"*Description:* {token_info['description']}\n"
-    
-    response += "\n"
-    
-    # Add deployment information
-    if token_info.get('deployer'):
-        response += f"👨‍💻 *Deployer:* `{token_info['deployer'][:8]}...{token_info['deployer'][-4:]}`\n"
-    
-    if token_info.get('deploy_date'):
-        response += f"📅 *Deployed on:* {token_info['deploy_date']}\n"
-    
-    if token_info.get('deploy_time'):
-        response += f"🕒 *Deploy time:* {token_info['deploy_time']}\n"
-    
-    # Add first buyers/interactors if available
-    if token_info.get('first_buyers') and len(token_info['first_buyers']) > 0:
-        response += f"\n👥 *First Interactors:*\n"
-        for i, buyer in enumerate(token_info['first_buyers']):
-            response += f"   {i+1}. `{buyer[:8]}...{buyer[-4:]}`\n"
-    
-    response += "\n"
-    
-    # Add supply information if available
-    if token_info.get('supply') is not None:
-        response += f"💰 *Total Supply:* {token_info['supply']:,.2f}"
-        if token_info.get('symbol'):
-            response += f" {token_info['symbol']}\n"
-        else:
-            response += "\n"
-    
-    if token_info.get('decimals') is not None:
-        response += f"🔢 *Decimals:* {token_info['decimals']}\n"
-    
-    response += "\n"
-    
-    # Add activity information
-    if token_info.get('activity_level'):
-        emoji_map = {
-            "Inactive": "⚪",
-            "Low": "🟠",
-            "Moderate": "🟢",
-            "High": "🟢🟢"
-        }
-        activity_emoji = emoji_map.get(token_info['activity_level'], "⚪")
-        response += f"🔄 *Activity Level:* {activity_emoji} {token_info['activity_level']}\n"
-    
-    if token_info.get('transaction_count') is not None:
-        response += f"📊 *Recent Transactions:* {token_info['transaction_count']}\n"
-    
-    if token_info.get('estimated_holders') is not None and token_info['estimated_holders'] != 'Unknown':
-        response += f"👥 *Est. Holders:* {token_info['estimated_holders']}\n"
-    
-    if token_info.get('recent_events') is not None:
-        response += f"📡 *Recent Events:* {token_info['recent_events']}\n"
-    
-    response += "\n"
-    
-    # Add ownership information
-    if token_info.get('owner') and token_info['owner'] != 'Unknown':
-        owner_type = "Unknown"
-        owner_address = "Unknown"
-        
-        if isinstance(token_info['owner'], dict):
-            if "AddressOwner" in token_info['owner']:
-                owner_type = "Address"
-                owner_address = token_info['owner']["AddressOwner"]
-            elif "ObjectOwner" in token_info['owner']:
-                owner_type = "Object"
-                owner_address = token_info['owner']["ObjectOwner"]
-            elif "Shared" in token_info['owner']:
-                owner_type = "Shared"
-                owner_address = "Multiple Owners"
-        
-        response += f"👤 *Ownership:* {owner_type}\n"
-        if owner_address != "Multiple Owners" and owner_address != "Unknown":
-            response += f"📝 *Owner:* `{owner_address[:10]}...{owner_address[-4:]}`\n"
-    
-    response += f"\n━━━━━━━━━━━━━━━━━━━━━\n"
-    response += f"Use `/check <address>` to analyze wallet stats"
+    parts.append(f"\n━━━━━━━━━━━━━━━━━━━━━\n")
+    parts.append(f"Use `/check <address>` to analyze wallet stats")
+    response = "".join(parts)
     
     # Send final response
     await update.message.reply_text(response, parse_mode='Markdown', reply_markup=reply_markup)
 
 
 # Function to analyze early trades and liquidity of a token
-async def get_token_trading_info(token_address):
+async def get_token_trading_info(session, token_address):
+    return await _cached(
+        _TRADING_CACHE,
+        ("token_trading", token_address),
+        lambda: _query_token_trading_info(session, token_address)
+    )
+
+async def _query_token_trading_info(session, token_address):
     try:
         # This function will attempt to find early trading data for a token
         # First, we'll look for events related to token creation or liquidity addition
         
         # Get token type from the object first
-        token_info = await get_token_contract_info(token_address)
-        if token_info.get("error"):
-            return {"error": token_info["error"]}
+        token_info = await get_token_contract_info(session, token_address)
+        if token_info.error:
+            return {"error": token_info.error}
         
-        token_type = token_info.get("type", "")
+        token_type = token_info.type or ""
         if not token_type:
             return {"error": "Couldn't determine token type"}
         
         # Extract module and package information
-        package = token_info.get("package")
-        module = token_info.get("module")
+        package = token_info.package
+        module = token_info.module
         
         if not package or not module:
             return {"error": "Couldn't extract package or module information"}
@@ -1003,9 +1481,6 @@ async def get_token_trading_info(token_address):
             ]
         }
         
-        liq_response = requests.post(SUI_RPC_URL, json=liquidity_events_payload)
-        liq_data = liq_response.json()
-        
         # Also try looking for transfer events
         transfer_events_payload = {
             "jsonrpc": "2.0",
@@ -1018,9 +1493,6 @@ async def get_token_trading_info(token_address):
             ]
         }
         
-        transfer_response = requests.post(SUI_RPC_URL, json=transfer_events_payload)
-        transfer_data = transfer_response.json()
-        
         # We'll try another common event type
         mint_events_payload = {
             "jsonrpc": "2.0",
@@ -1033,8 +1505,21 @@ async def get_token_trading_info(token_address):
             ]
         }
         
-        mint_response = requests.post(SUI_RPC_URL, json=mint_events_payload)
-        mint_data = mint_response.json()
+        # The three event queries are independent, so send them as one JSON-RPC batch
+        # (or concurrently when USE_BATCH_RPC is off); a failed query just yields no events
+        liq_data, transfer_data, mint_data = results = [
+            {"error": {"message": str(result)}} if isinstance(result, Exception) else result
+            for result in await _post_rpc_many(
+                session, [liquidity_events_payload, transfer_events_payload, mint_events_payload]
+            )
+        ]
+        
+        # "No events" is only an answer if the queries succeeded; otherwise report it and skip the cache
+        failed = [result for result in results if "error" in result]
+        if len(failed) == len(results):
+            error = failed[0]["error"]
+            message = error.get("message", "unknown error") if isinstance(error, dict) else error
+            return {"error": f"Error fetching trading events: {message}"}
         
         # Initialize results
         trading_info = {
@@ -1045,7 +1530,9 @@ async def get_token_trading_info(token_address):
             "first_liquidity_amount": None,
             "first_liquidity_time": None,
             "early_minters": [],
-            "early_traders": []
+            "early_traders": [],
+            # Some event queries failed, so the counts may be low; shown but never cached
+            "partial": bool(failed)
         }
         
         # Parse liquidity events
@@ -1060,8 +1547,7 @@ async def get_token_trading_info(token_address):
                 # Extract timestamp if available
                 if "timestampMs" in first_event:
                     timestamp_ms = int(first_event["timestampMs"])
-                    from datetime import datetime
-                    event_date = datetime.fromtimestamp(timestamp_ms / 1000)
+                    event_date = datetime.fromtimestamp(timestamp_ms / 1000, timezone.utc)
                     trading_info["first_liquidity_time"] = event_date.strftime("%Y-%m-%d %H:%M:%S UTC")
                 
                 # Try to extract sender (liquidity provider)
@@ -1105,8 +1591,31 @@ async def get_token_trading_info(token_address):
         logger.error(f"Error analyzing token trading: {str(e)}")
         return {"error": f"Error analyzing token trading: {str(e)}"}
 
+# Placeholder for optional steps passed to asyncio.gather
+async def _noop():
+    return None
+
+# Function to fetch the digests of recent transactions sent by an address
+async def _fetch_tx_digests(session, address):
+    tx_payload = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "suix_queryTransactionBlocks",
+        "params": [
+            {"FromAddress": address},
+            {"limit": 20, "descendingOrder": True},
+            None
+        ]
+    }
+    
+    tx_data = await _post_rpc(session, tx_payload)
+    
+    if "result" in tx_data and "data" in tx_data["result"]:
+        return address, set(tx["digest"] for tx in tx_data["result"]["data"])
+    return address, set()
+
 # Function to check if addresses are related (share transactions)
-async def check_related_addresses(address_list):
+async def check_related_addresses(session, address_list):
     if not address_list or len(address_list) < 2:
         return {"related": False, "reason": "Not enough addresses to compare"}
     
@@ -1121,47 +1630,23 @@ async def check_related_addresses(address_list):
         # Check for common transactions between addresses
         # This is a simplified approach - production systems would use more sophisticated methods
         
-        # Get recent transactions for each address
-        address_transactions = {}
-        
-        for address in address_list:
-            # Get transactions sent by this address
-            tx_payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "suix_queryTransactionBlocks",
-                "params": [
-                    {"FromAddress": address},
-                    {"limit": 20, "descendingOrder": True},
-                    None
-                ]
-            }
-            
-            tx_response = requests.post(SUI_RPC_URL, json=tx_payload)
-            tx_data = tx_response.json()
-            
-            if "result" in tx_data and "data" in tx_data["result"]:
-                address_transactions[address] = set(tx["digest"] for tx in tx_data["result"]["data"])
-            else:
-                address_transactions[address] = set()
+        # Get recent transactions for each address; the lookups are independent, so run them together
+        results = await asyncio.gather(*[_fetch_tx_digests(session, address) for address in address_list])
+        address_transactions = dict(results)
         
-        # Check for common transactions
-        common_txs = set()
-        addresses = list(address_transactions.keys())
+        # Check for common transactions: record which addresses saw each digest,
+        # any digest seen by two or more addresses is shared
+        seen_by = defaultdict(list)
+        for address, digests in address_transactions.items():
+            for digest in digests:
+                seen_by[digest].append(address)
         
-        for i in range(len(addresses)):
-            for j in range(i+1, len(addresses)):
-                addr1 = addresses[i]
-                addr2 = addresses[j]
-                
-                # Find intersection of transaction sets
-                intersection = address_transactions[addr1].intersection(address_transactions[addr2])
-                common_txs.update(intersection)
+        common_txs = [digest for digest, addresses in seen_by.items() if len(addresses) >= 2]
         
         # If we found common transactions, they might be related
         if common_txs:
             related_info["related"] = True
-            related_info["common_transactions"] = list(common_txs)
+            related_info["common_transactions"] = common_txs
             related_info["reason"] = f"Found {len(common_txs)} common transactions"
         
         # Add more sophisticated pattern detection here in a production system
@@ -1171,6 +1656,29 @@ async def check_related_addresses(address_list):
         logger.error(f"Error checking related addresses: {str(e)}")
         return {"error": f"Error checking related addresses: {str(e)}"}
 
+# Warm the /check caches for an address the user is likely to look up next, one lookup at a time
+async def _prefetch_wallet(session, wallet_address):
+    # Each task runs in its own copy of the context, so this only throttles the prefetch's own RPCs
+    _BACKGROUND_RPC.set(True)
+    for fetch in (_fetch_coins, _fetch_owned_objects, get_wallet_activity):
+        try:
+            await fetch(session, wallet_address)
+        except Exception as e:
+            logger.warning(f"Wallet prefetch failed for {wallet_address}: {str(e)}")
+
+# Start background prefetches for wallet addresses without waiting on them
+def _schedule_wallet_prefetch(session, addresses):
+    for address in addresses:
+        if len(_BACKGROUND_TASKS) >= PREFETCH_MAX_PENDING:
+            return
+        if address and SUI_ADDRESS_RE.fullmatch(address):
+            task = asyncio.create_task(_prefetch_wallet(session, address))
+            _BACKGROUND_TASKS.add(task)
+            task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+# Shown under partial /enhanced_token_info results while the remaining checks run
+ANALYSIS_PENDING_NOTE = "\n⏳ _Checking trading activity and related addresses..._"
+
 # Enhanced token info command that includes trading analysis and relationship checks
 async def enhanced_token_info_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     # This is an extended version of token_info_command with additional analysis
@@ -1201,21 +1709,43 @@ async def enhanced_token_info_command(update: Update, context: ContextTypes.DEFA
     loading_message = await update.message.reply_text(f"🔍 Analyzing token: {token_address}...")
     
     # Get basic token information
-    token_info = await get_token_contract_info(token_address)
+    session = context.bot_data["http"]
+    token_info = await get_token_contract_info(session, token_address)
     
-    if token_info.get("error"):
+    if token_info.error:
         await update.message.reply_text(
-            f"❌ *Error analyzing token*\n\n{token_info['error']}", 
+            f"❌ *Error analyzing token*\n\n{token_info.error}", 
             parse_mode='Markdown'
         )
         return
     
-    # Get additional trading information
-    trading_info = await get_token_trading_info(token_address)
+    # Get additional trading information and check for relationships between
+    # deployer and first buyers; both only need the token info above, so run them together
+    # first_buyers already excludes the deployer and is unique, so this list has no duplicates
+    addresses_to_check = [addr for addr in [token_info.deployer] + token_info.first_buyers if addr]
+    
+    trading_task = asyncio.create_task(get_token_trading_info(session, token_address))
+    relationship_task = asyncio.create_task(
+        check_related_addresses(session, addresses_to_check) if len(addresses_to_check) >= 2 else _noop()
+    )
     
-    # Check for relationships between deployer and first buyers
-    addresses_to_check = [addr for addr in [token_info.get("deployer")] + token_info.get("first_buyers", []) if addr]
-    relationship_info = await check_related_addresses(addresses_to_check) if len(addresses_to_check) >= 2 else None
+    # Show the basic analysis in place of the loading message while the slower checks run, then
+    # add the trading section as soon as it is ready if the relationship check is still going
+    await _edit_message_quietly(
+        loading_message,
+        "".join(_render_token_common(token_info, token_address)) + ANALYSIS_PENDING_NOTE,
+        parse_mode='Markdown'
+    )
+    
+    trading_info = await trading_task
+    if not relationship_task.done():
+        await _edit_message_quietly(
+            loading_message,
+            "".join(_render_token_common(token_info, token_address, _render_trading(trading_info))) + ANALYSIS_PENDING_NOTE,
+            parse_mode='Markdown'
+        )
+    
+    relationship_info = await relationship_task
     
     # Build explorer links
     suiscan_link = f"{SUISCAN_URL}object/{token_address}"
@@ -1230,145 +1760,28 @@ async def enhanced_token_info_command(update: Update, context: ContextTypes.DEFA
     ]
     
     # Add link to check deployer if available
-    if token_info.get("deployer"):
+    if token_info.deployer:
         keyboard.append([
-            InlineKeyboardButton("👨‍💻 Check Deployer", url=f"{SUISCAN_URL}account/{token_info['deployer']}")
+            InlineKeyboardButton("👨‍💻 Check Deployer", url=f"{SUISCAN_URL}account/{token_info.deployer}")
         ])
     
     reply_markup = InlineKeyboardMarkup(keyboard)
     
-    # Format basic response (same as token_info_command)
-    response = f"🪙 *TOKEN ANALYSIS* 🪙\n"
-    response += f"━━━━━━━━━━━━━━━━━━━━━\n\n"
-    
-    response += f"*Token:* {token_info.get('name', 'Unknown')}"
-    if token_info.get('symbol') and token_info['symbol'] != token_info.get('name', ''):
-        response += f" ({token_info['symbol']})\n"
-    else:
-        response += "\n"
-    
-    response += f"*Address:* `{token_address[:10]}...{token_address[-4:] if len(token_address) > 14 else token_address[-4:]}`\n"
-    
-    if token_info.get('type'):
-        response += f"*Type:* `{token_info['type']}`\n"
-    
-    if token_info.get('description') and token_info['description'] != 'Unknown':
-        response += f"*Description:* {token_info['description']}\n"
-    
-    response += "\n"
-    
-    # Add deployment information
-    if token_info.get('deployer'):
-        response += f"👨‍💻 *Deployer:* `{token_info['deployer'][:8]}...{token_info['deployer'][-4:]}`\n"
-    
-    if token_info.get('deploy_date'):
-        response += f"📅 *Deployed on:* {token_info['deploy_date']}\n"
-    
-    if token_info.get('deploy_time'):
-        response += f"🕒 *Deploy time:* {token_info['deploy_time']}\n"
-    
-    # Add first buyers/interactors if available
-    if token_info.get('first_buyers') and len(token_info['first_buyers']) > 0:
-        response += f"\n👥 *First Interactors:*\n"
-        for i, buyer in enumerate(token_info['first_buyers']):
-            response += f"   {i+1}. `{buyer[:8]}...{buyer[-4:]}`\n"
-    
-    # Add relationship analysis if available
-    if relationship_info and not relationship_info.get("error"):
-        if relationship_info.get("related"):
-            response += f"\n⚠️ *Potential Related Addresses:* Yes\n"
-            response += f"   {relationship_info.get('reason', 'Common transaction patterns detected')}\n"
-        else:
-            response += f"\n✅ *Related Addresses:* No evidence found\n"
-    
-    # Add trading information if available
-    if trading_info and not trading_info.get("error"):
-        response += f"\n💱 *Trading Analysis:*\n"
-        
-        if trading_info.get("first_liquidity_provider"):
-            response += f"   First LP: `{trading_info['first_liquidity_provider'][:8]}...{trading_info['first_liquidity_provider'][-4:]}`\n"
-        
-        if trading_info.get("first_liquidity_time"):
-            response += f"   First Liquidity: {trading_info['first_liquidity_time']}\n"
-        
-        if trading_info.get("liquidity_events"):
-            response += f"   Liquidity Events: {trading_info['liquidity_events']}\n"
-        
-        if trading_info.get("transfer_events"):
-            response += f"   Transfer Events: {trading_info['transfer_events']}\n"
-        
-        if trading_info.get("mint_events"):
-            response += f"   Mint Events: {trading_info['mint_events']}\n"
-    
-    response += "\n"
-    
-    # Add supply information if available
-    if token_info.get('supply') is not None:
-        response += f"💰 *Total Supply:* {token_info['supply']:,.2f}"
-        if token_info.get('symbol'):
-            response += f" {token_info['symbol']}\n"
-        else:
-            response += "\n"
-    
-    if token_info.get('decimals') is not None:
-        response += f"🔢 *Decimals:* {token_info['decimals']}\n"
-    
-    response += "\n"
-    
-    # Add activity information
-    if token_info.get('activity_level'):
-        emoji_map = {
-            "Inactive": "⚪",
-            "Low": "🟠",
-            "Moderate": "🟢",
-            "High": "🟢🟢"
-        }
-        activity_emoji = emoji_map.get(token_info['activity_level'], "⚪")
-        response += f"🔄 *Activity Level:* {activity_emoji} {token_info['activity_level']}\n"
-    
-    if token_info.get('transaction_count') is not None:
-        response += f"📊 *Recent Transactions:* {token_info['transaction_count']}\n"
-    
-    if token_info.get('estimated_holders') is not None and token_info['estimated_holders'] != 'Unknown':
-        response += f"👥 *Est. Holders:* {token_info['estimated_holders']}\n"
-    
-    if token_info.get('recent_events') is not None:
-        response += f"📡 *Recent Events:* {token_info['recent_events']}\n"
-    
-    response += "\n"
-    
-    # Add ownership information
-    if token_info.get('owner') and token_info['owner'] != 'Unknown':
-        owner_type = "Unknown"
-        owner_address = "Unknown"
-        
-        if isinstance(token_info['owner'], dict):
-            if "AddressOwner" in token_info['owner']:
-                owner_type = "Address"
-                owner_address = token_info['owner']["AddressOwner"]
-            elif "ObjectOwner" in token_info['owner']:
-                owner_type = "Object"
-                owner_address = token_info['owner']["ObjectOwner"]
-            elif "Shared" in token_info['owner']:
-                owner_type = "Shared"
-                owner_address = "Multiple Owners"
-        
-        response += f"👤 *Ownership:* {owner_type}\n"
-        if owner_address != "Multiple Owners" and owner_address != "Unknown":
-            response += f"📝 *Owner:* `{owner_address[:10]}...{owner_address[-4:]}`\n"
+    # Format basic response (same as token_info_command) with the relationship and trading sections
+    parts = _render_token_common(
+        token_info, token_address, _render_relationship(relationship_info) + _render_trading(trading_info)
+    )
     
     # Add risk assessment section
-    response += f"\n🔒 *Risk Assessment:*\n"
+    parts.append(f"\n🔒 *Risk Assessment:*\n")
     
     # Calculate risk factors
     risk_factors = []
     risk_level = "Low"
     
     # Check for recently deployed tokens (potential risk)
-    if token_info.get('deploy_date'):
-        from datetime import datetime, timedelta
-        deploy_date = datetime.strptime(token_info['deploy_date'], "%Y-%m-%d")
-        days_since_deploy = (datetime.now() - deploy_date).days
+    if token_info.deploy_ts is not None:
+        days_since_deploy = int((time.time() - token_info.deploy_ts) // 86400)
         
         if days_since_deploy < 3:
             risk_factors.append("Very recent token (less than 3 days old)")
@@ -1384,7 +1797,7 @@ async def enhanced_token_info_command(update: Update, context: ContextTypes.DEFA
             risk_level = "Medium"
     
     # Check for low transaction count
-    if token_info.get('transaction_count') is not None and token_info['transaction_count'] < 10:
+    if token_info.transaction_count is not None and token_info.transaction_count < 10:
         risk_factors.append("Low transaction volume")
         if risk_level != "High":
             risk_level = "Medium"
@@ -1396,21 +1809,51 @@ async def enhanced_token_info_command(update: Update, context: ContextTypes.DEFA
         "High": "🔴"
     }
     
-    response += f"   *Level:* {risk_emoji.get(risk_level, '⚪')} {risk_level}\n"
+    parts.append(f"   *Level:* {risk_emoji.get(risk_level, '⚪')} {risk_level}\n")
     
     if risk_factors:
-        response += "   *Factors:*\n"
+        parts.append("   *Factors:*\n")
         for factor in risk_factors:
-            response += f"     - {factor}\n"
+            parts.append(f"     - {factor}\n")
     else:
-        response += "   No significant risk factors detected\n"
+        parts.append("   No significant risk factors detected\n")
     
-    response += f"\n━━━━━━━━━━━━━━━━━━━━━\n"
-    response += f"Use `/check <address>` to analyze wallet stats"
+    parts.append(f"\n━━━━━━━━━━━━━━━━━━━━━\n")
+    parts.append(f"Use `/check <address>` to analyze wallet stats")
+    response = "".join(parts)
     
-    # Delete the loading message and send the final response
-    await context.bot.delete_message(chat_id=update.effective_chat.id, message_id=loading_message.message_id)
-    await update.message.reply_text(response, parse_mode='Markdown', reply_markup=reply_markup) 
+    # Replace the progress message with the full report; send it fresh if the message can't be edited
+    try:
+        await loading_message.edit_text(response, parse_mode='Markdown', reply_markup=reply_markup)
+    except TelegramError as e:
+        logger.warning(f"Could not edit token report into place: {str(e)}")
+        await update.message.reply_text(response, parse_mode='Markdown', reply_markup=reply_markup)
+    
+    # Users usually follow up with /check on the deployer or a first buyer, so warm those caches now
+    _schedule_wallet_prefetch(session, addresses_to_check)
+
+# Admin command that drops every cached lookup, in-process and in Redis
+async def flush_cache_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    if update.effective_user is None or update.effective_user.id not in ADMIN_USER_IDS:
+        await update.message.reply_text("⛔ This command is only available to bot admins.")
+        return
+    
+    for cache in (_COIN_CACHE, _OBJECT_CACHE, _ACTIVITY_CACHE, _TOKEN_STATIC_CACHE, _TOKEN_ACTIVITY_CACHE, _TRADING_CACHE):
+        cache.clear()
+    _PRICE_CACHE.update(ts=0.0, data=None)
+    
+    redis_note = ""
+    if _REDIS is not None:
+        try:
+            keys = [key async for key in _REDIS.scan_iter(match="sui:*", count=500)]
+            if keys:
+                await _REDIS.delete(*keys)
+            redis_note = f"\nRemoved {len(keys)} Redis keys"
+        except RedisError as e:
+            logger.error(f"Error flushing Redis cache: {str(e)}")
+            redis_note = "\n⚠️ Redis cache could not be cleared"
+    
+    await update.message.reply_text(f"🧹 *Caches cleared*{redis_note}", parse_mode='Markdown')
     
 # Add near the top of your main.py file
 import os
@@ -1429,6 +1872,32 @@ class Handler(BaseHTTPRequestHandler):
         # Suppress log messages
         return
 
+# Create the shared HTTP session once the application's event loop is running
+async def post_init(application: Application) -> None:
+    # Keep warm HTTPS connections to the Sui node instead of a handshake per call
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=32,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+        ttl_dns_cache=600
+    )
+    application.bot_data["http"] = aiohttp.ClientSession(connector=connector, timeout=HTTP_TIMEOUT)
+
+# Close the shared HTTP session on shutdown
+async def post_shutdown(application: Application) -> None:
+    # Stop any prefetches still running before their session goes away
+    for task in list(_BACKGROUND_TASKS):
+        task.cancel()
+    if _BACKGROUND_TASKS:
+        await asyncio.gather(*_BACKGROUND_TASKS, return_exceptions=True)
+    
+    session = application.bot_data.pop("http", None)
+    if session:
+        await session.close()
+    if _REDIS is not None:
+        await _REDIS.aclose()
+
 # main fuction
 
 def main() -> None:
@@ -1439,7 +1908,13 @@ def main() -> None:
         return
     
     # Create the Application
-    application = Application.builder().token(token).build()
+    application = (
+        Application.builder()
+        .token(token)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
     
    # Add command handlers
     application.add_handler(CommandHandler("start", start))
@@ -1448,6 +1923,7 @@ def main() -> None:
     application.add_handler(CommandHandler("token", token_command))
     application.add_handler(CommandHandler("token_info", token_info_command))
     application.add_handler(CommandHandler("enhanced_token_info", enhanced_token_info_command))  # Add this new command
+    application.add_handler(CommandHandler("flush_cache", flush_cache_command))
     
     # Run the bot
     application.run_polling()